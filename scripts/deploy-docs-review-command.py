@@ -10,16 +10,25 @@ Usage:
     python3 deploy-docs-review-command.py repos.txt
     python3 deploy-docs-review-command.py repos.txt --commit --push
     python3 deploy-docs-review-command.py repos.txt --dry-run
+    python3 deploy-docs-review-command.py repos.txt --commit --push --jobs 16
 """
 
 import argparse
+import hashlib
 import os
-import shutil
+import queue
+import shlex
 import subprocess
 import sys
 import tempfile
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import partial
 from pathlib import Path
-from typing import List, Tuple
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Set, Tuple
+from urllib.parse import urlparse
 
 
 class Colors:
@@ -31,13 +40,53 @@ class Colors:
     NC = '\033[0m'  # No Color
 
 
+COMMIT_MSG = """Add API documentation review command
+
+Add /review-docs slash command for consistent API documentation review
+across Ballerina connectors for low-code editor compatibility.
+
+Co-Authored-By: Claude <noreply@anthropic.com>"""
+
+# Location of the command inside each repository, relative to its root
+TARGET_PATH = '.claude/commands/review-docs.md'
+
+# Exit codes reported by the commit script (see build_commit_script)
+EXIT_NO_CHANGES = 3
+EXIT_PUSH_FAILED = 4
+
+# Bare mirrors shared by all repositories of an organization
+MIRROR_CACHE_DIR = Path.home() / '.cache' / 'deploy-docs'
+
+# One MirrorLock per mirror (see get_mirror_lock)
+_mirror_locks: Dict[str, 'MirrorLock'] = {}
+_mirror_locks_lock = threading.Lock()
+_pruned_mirrors: Set[str] = set()
+
+
+def colored(text: str, color: str) -> str:
+    """Wrap text in ANSI color codes"""
+    return f"{color}{text}{Colors.NC}"
+
+
 def print_colored(text: str, color: str):
     """Print colored text"""
-    print(f"{color}{text}{Colors.NC}")
+    print(colored(text, color))
 
 
-def run_command(cmd: List[str], cwd: str = None, capture_output: bool = True) -> Tuple[bool, str]:
-    """Run a shell command and return success status and output"""
+def run_command(
+    cmd: List[str],
+    cwd: str = None,
+    capture_output: bool = True,
+    quiet: bool = False
+) -> Tuple[bool, str]:
+    """
+    Run a shell command and return success status and output.
+    With quiet=True output is discarded instead of captured, for callers
+    that only need the exit status.
+    """
+    if quiet:
+        result = subprocess.run(cmd, cwd=cwd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        return result.returncode == 0, ""
     try:
         result = subprocess.run(
             cmd,
@@ -51,6 +100,85 @@ def run_command(cmd: List[str], cwd: str = None, capture_output: bool = True) ->
         return False, e.stderr if capture_output else ""
 
 
+class ShellWorker:
+    """Long-lived bash process that runs scripts sent over stdin"""
+
+    def __init__(self):
+        self.proc = subprocess.Popen(
+            ['bash'],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            bufsize=1
+        )
+
+    def run(self, script: str, env: Dict[str, str] = None) -> Tuple[int, str]:
+        """Run a script and return its exit code and combined output"""
+        sentinel = f"__DONE_{uuid.uuid4().hex}__"
+        assignments = ''.join(f"{name}={shlex.quote(value)}\n" for name, value in (env or {}).items())
+        # The subshell keeps exits and variables local to this script, and detaching
+        # stdin stops commands from reading the rest of the protocol
+        self.proc.stdin.write(f"(\n{assignments}{script}\n) </dev/null\nprintf '\\n%s %d\\n' {sentinel} $?\n")
+        self.proc.stdin.flush()
+
+        output = []
+        for line in self.proc.stdout:
+            if line.startswith(sentinel):
+                return int(line.split()[1]), ''.join(output)
+            output.append(line)
+        return 1, ''.join(output) + "bash worker exited unexpectedly"
+
+    def close(self):
+        """Close stdin and wait for bash to exit"""
+        try:
+            self.proc.stdin.close()
+        except BrokenPipeError:
+            pass  # bash already exited, e.g. after Ctrl-C
+        self.proc.wait()
+
+
+# One ShellWorker per thread, tracked so main can shut them all down
+_thread_state = threading.local()
+_shell_workers: List[ShellWorker] = []
+_shell_workers_lock = threading.Lock()
+
+
+def run_shell(script: str, env: Dict[str, str] = None) -> Tuple[int, str]:
+    """Run a bash script in this thread's ShellWorker and return its exit code and output"""
+    worker = getattr(_thread_state, 'shell', None)
+    if worker is None:
+        worker = _thread_state.shell = ShellWorker()
+        with _shell_workers_lock:
+            _shell_workers.append(worker)
+    return worker.run(script, env)
+
+
+def close_shell_workers():
+    """Shut down every ShellWorker started by run_shell"""
+    with _shell_workers_lock:
+        while _shell_workers:
+            _shell_workers.pop().close()
+
+
+def build_commit_script(do_push: bool, push_args: Sequence[str] = ()) -> str:
+    """
+    Build a bash script that stages $TARGET (relative to the repository root) in the
+    repository at $REPO, commits it with $MSG and optionally pushes with push_args.
+    Uses 'git -C' so no working directory is needed.
+    Exits with EXIT_NO_CHANGES if $TARGET has nothing to commit and EXIT_PUSH_FAILED
+    if the commit succeeded but the push did not.
+    """
+    script = f"""git -C "$REPO" add -- "$TARGET" || exit 1
+git -C "$REPO" diff --cached --quiet -- "$TARGET" && exit {EXIT_NO_CHANGES}
+git -C "$REPO" commit --quiet -m "$MSG" || exit 1
+"""
+    if do_push:
+        push_cmd = ' '.join(['git', '-C', '"$REPO"', 'push', *map(shlex.quote, push_args)])
+        script += f'{push_cmd} || exit {EXIT_PUSH_FAILED}\n'
+    return script
+
+
 def is_git_repo(path: str) -> bool:
     """Check if directory is a git repository"""
     return os.path.isdir(os.path.join(path, '.git'))
@@ -61,113 +189,352 @@ def is_remote_url(repo_path: str) -> bool:
     return repo_path.startswith('http://') or repo_path.startswith('https://') or repo_path.startswith('git@')
 
 
-def clone_repository(repo_url: str, target_dir: str) -> bool:
-    """Clone a git repository"""
-    success, _ = run_command(['git', 'clone', repo_url, target_dir])
-    return success
+def parse_repo_url(repo_url: str) -> Tuple[str, str]:
+    """Split a remote URL into (org, repo)"""
+    if repo_url.startswith('git@'):
+        path = repo_url.split(':', 1)[1]
+    else:
+        path = urlparse(repo_url).path
+    parts = path.strip('/').split('/')
+    repo = parts[-1].removesuffix('.git')
+    org = parts[-2] if len(parts) > 1 else repo
+    return org, repo
 
 
-def read_repo_list(file_path: str) -> List[str]:
-    """Read repository list from file, filtering comments and empty lines"""
-    repos = []
-    with open(file_path, 'r') as f:
-        for line in f:
-            line = line.strip()
-            if line and not line.startswith('#'):
-                repos.append(line)
-    return repos
-
-
-def process_repository(
-    repo_path: str,
-    prompt_source: str,
-    temp_dir: str,
-    do_commit: bool,
-    do_push: bool,
-    dry_run: bool
-) -> Tuple[bool, str]:
+class MirrorLock:
     """
-    Process a single repository
-    Returns: (success: bool, message: str)
+    Reader/writer lock for a bare mirror. Fetches and checkouts walk every ref of the
+    mirror, including the HEAD of each registered worktree, so they must not overlap
+    with registering a worktree or changing the config. They can overlap each other.
+    Waiting writers hold back new readers so registration is not starved.
     """
-    # Determine local path
-    if is_remote_url(repo_path):
-        repo_name = os.path.basename(repo_path).replace('.git', '')
-        local_path = os.path.join(temp_dir, repo_name)
 
-        print("  Cloning repository...")
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._readers = 0
+        self._writing = False
+        self._writers_waiting = 0
+
+    @contextmanager
+    def shared(self):
+        """Hold the lock alongside other readers"""
+        with self._cond:
+            self._cond.wait_for(lambda: not self._writing and not self._writers_waiting)
+            self._readers += 1
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._readers -= 1
+                self._cond.notify_all()
+
+    @contextmanager
+    def exclusive(self):
+        """Hold the lock alone"""
+        with self._cond:
+            self._writers_waiting += 1
+            self._cond.wait_for(lambda: not self._writing and not self._readers)
+            self._writers_waiting -= 1
+            self._writing = True
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._writing = False
+                self._cond.notify_all()
+
+
+def get_mirror_lock(mirror: str) -> MirrorLock:
+    """Return the lock guarding a mirror's refs, config and worktree metadata"""
+    with _mirror_locks_lock:
+        return _mirror_locks.setdefault(mirror, MirrorLock())
+
+
+def promisor_args(remote: str) -> List[str]:
+    """
+    Git options marking remote as the partial-clone source for a single command.
+    This is not stored in the mirror config: with every remote a promisor, git
+    would try each of them in turn for every missing blob.
+    """
+    return ['-c', f'remote.{remote}.promisor=true', '-c', f'remote.{remote}.partialclonefilter=blob:none']
+
+
+def prepare_mirror(mirror: str, remote: str, repo_url: str) -> Tuple[bool, str]:
+    """
+    Create the bare mirror if needed and register repo_url as a remote.
+    The caller must hold the mirror lock exclusively.
+    Returns: (success: bool, git error output)
+    """
+    if not os.path.isdir(mirror):
+        os.makedirs(os.path.dirname(mirror), exist_ok=True)
+        success, error = run_command(['git', 'init', '--bare', '--quiet', mirror])
+        if not success:
+            return False, error
+        # Repacking a mirror with blobs missing would fail, so never gc it automatically
+        run_command(['git', '-C', mirror, 'config', 'gc.auto', '0'], quiet=True)
+
+    if mirror not in _pruned_mirrors:
+        # Forget worktrees left behind in temporary directories by earlier runs
+        run_command(['git', '-C', mirror, 'worktree', 'prune'], quiet=True)
+        _pruned_mirrors.add(mirror)
+
+    has_remote, url = run_command(['git', '-C', mirror, 'config', '--get', f'remote.{remote}.url'])
+    if has_remote:
+        if url.strip() == repo_url:
+            return True, ""
+        return run_command(['git', '-C', mirror, 'remote', 'set-url', remote, repo_url])
+
+    return run_command(['git', '-C', mirror, 'remote', 'add', remote, repo_url])
+
+
+def checkout_worktree(repo_url: str, target_dir: str) -> Tuple[bool, str, List[str]]:
+    """
+    Check out the default branch of repo_url at target_dir as a detached worktree of
+    the shared bare mirror for its organization, fetching only what is missing.
+    Returns: (success: bool, git error output,
+              git push arguments for a commit made in the worktree)
+    """
+    org, remote = parse_repo_url(repo_url)
+    mirror = str(MIRROR_CACHE_DIR / f'{org}.git')
+    lock = get_mirror_lock(mirror)
+
+    with lock.exclusive():
+        success, error = prepare_mirror(mirror, remote, repo_url)
+    if not success:
+        return False, error, []
+
+    success, output = run_command(['git', '-C', mirror, 'ls-remote', '--symref', remote, 'HEAD'])
+    if not success:
+        return False, output, []
+    if not output.startswith('ref: refs/heads/'):
+        return False, "remote HEAD does not point to a branch", []
+    branch = output.split('\t', 1)[0].removeprefix('ref: refs/heads/')
+    ref = f'refs/remotes/{remote}/{branch}'
+
+    # Fetches of different remotes may run concurrently: each updates only its own
+    # ref and skips the shared FETCH_HEAD. They fetch full commit and tree history
+    # because a --depth fetch would race on the mirror's shared 'shallow' file, and
+    # --filter=tree:0 would make the checkout fetch every missing tree one by one.
+    # After the first run only new commits are fetched.
+    with lock.shared():
+        success, error = run_command([
+            'git', '-C', mirror, *promisor_args(remote), 'fetch', '--quiet', '--no-tags', '--no-write-fetch-head',
+            '--filter=blob:none', remote, f'+refs/heads/{branch}:{ref}'
+        ])
+    if not success:
+        return False, error, []
+
+    # Registering the worktree adds a HEAD that concurrent ref walks could see half-written
+    with lock.exclusive():
+        success, error = run_command(
+            ['git', '-C', mirror, 'worktree', 'add', '--quiet', '--no-checkout', '--detach', target_dir, ref]
+        )
+    if not success:
+        return False, error, []
+
+    # Populating the index and files fetches the tip's blobs on demand
+    with lock.shared():
+        success, error = run_command(
+            ['git', '-C', target_dir, *promisor_args(remote), 'reset', '--hard', '--quiet']
+        )
+    if not success:
+        return False, error, []
+    return True, "", [remote, f'HEAD:refs/heads/{branch}']
+
+
+def write_file(path: str, data: bytes):
+    """Write data to path, creating or truncating it"""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+def _file_matches(path: str, expected_digest: bytes) -> bool:
+    """Check whether the file at path hashes to expected_digest"""
+    try:
+        with open(path, 'rb') as f:
+            return hashlib.blake2b(f.read()).digest() == expected_digest
+    except FileNotFoundError:
+        return False
+
+
+def read_repo_list(file_path: str) -> List[str]:
+    """Read repository list from file, filtering comments, empty lines and duplicates"""
+    lines = Path(file_path).read_text().splitlines()
+    stripped = (line.strip() for line in lines)
+    # dict.fromkeys keeps the first occurrence of each entry in order
+    return list(dict.fromkeys(line for line in stripped if line and not line.startswith('#')))
+
+
+class RepoJob:
+    """State of one repository as it moves through the pipeline stages"""
+
+    def __init__(self, repo_path: str):
+        self.repo_path = repo_path
+        self.log: List[str] = []
+        self.local_path = ''
+        self.target_file = ''
+        self.push_args: List[str] = []
+        self.up_to_date = False
+        # (success, message) once the repository needs no further stages
+        self.result: Optional[Tuple[bool, str]] = None
+
+
+def checkout_stage(job: RepoJob, temp_dir: str, dry_run: bool):
+    """Resolve the local path of a repository, checking out remote ones"""
+    if is_remote_url(job.repo_path):
+        org, repo_name = parse_repo_url(job.repo_path)
+        job.local_path = os.path.join(temp_dir, repo_name)
+
+        job.log.append("  Cloning repository...")
         if dry_run:
-            print(f"  [DRY RUN] Would clone: {repo_path} to {local_path}")
+            job.log.append(f"  [DRY RUN] Would check out: {job.repo_path} to {job.local_path} "
+                           f"from mirror {MIRROR_CACHE_DIR / f'{org}.git'}")
         else:
-            if not clone_repository(repo_path, local_path):
-                return False, "Failed to clone repository"
-            print_colored("  ✓ Cloned successfully", Colors.GREEN)
+            success, error, job.push_args = checkout_worktree(job.repo_path, job.local_path)
+            if not success:
+                job.result = (False, f"Failed to clone repository: {error.strip()}")
+                return
+            job.log.append(colored("  ✓ Cloned successfully", Colors.GREEN))
     else:
-        local_path = repo_path
+        job.local_path = job.repo_path
 
-        if not os.path.isdir(local_path):
-            return False, f"Directory not found: {local_path}"
+        if not os.path.isdir(job.local_path):
+            job.result = (False, f"Directory not found: {job.local_path}")
+        elif not is_git_repo(job.local_path):
+            job.result = (False, f"Not a git repository: {job.local_path}")
 
-        if not is_git_repo(local_path):
-            return False, f"Not a git repository: {local_path}"
 
-    # Create .claude/commands directory
-    claude_dir = os.path.join(local_path, '.claude', 'commands')
-    target_file = os.path.join(claude_dir, 'review-docs.md')
+def write_stage(job: RepoJob, prompt_bytes: bytes, prompt_digest: bytes, do_commit: bool, dry_run: bool):
+    """Write review-docs.md into the repository unless it is already up to date"""
+    claude_dir = os.path.join(job.local_path, '.claude', 'commands')
+    job.target_file = os.path.join(claude_dir, 'review-docs.md')
+
+    job.up_to_date = not dry_run and _file_matches(job.target_file, prompt_digest)
+    # A fresh worktree matches HEAD, so a matching file there is already committed
+    if job.up_to_date and (not do_commit or is_remote_url(job.repo_path)):
+        job.result = (True, "review-docs.md already up to date")
+        return
 
-    print("  Creating .claude/commands directory...")
+    # Create .claude/commands directory
+    job.log.append("  Creating .claude/commands directory...")
     if dry_run:
-        print(f"  [DRY RUN] Would create: {claude_dir}")
+        job.log.append(f"  [DRY RUN] Would create: {claude_dir}")
     else:
         os.makedirs(claude_dir, exist_ok=True)
-        print_colored("  ✓ Directory ready", Colors.GREEN)
+        job.log.append(colored("  ✓ Directory ready", Colors.GREEN))
 
     # Copy the prompt file
-    print("  Copying review-docs.md...")
+    job.log.append("  Copying review-docs.md...")
     if dry_run:
-        print(f"  [DRY RUN] Would copy: {prompt_source} -> {target_file}")
+        job.log.append(f"  [DRY RUN] Would copy: review-docs.md -> {job.target_file}")
+    elif job.up_to_date:
+        job.log.append(colored("  ✓ File already up to date", Colors.GREEN))
     else:
-        shutil.copy2(prompt_source, target_file)
-        print_colored("  ✓ File copied", Colors.GREEN)
+        write_file(job.target_file, prompt_bytes)
+        job.log.append(colored("  ✓ File copied", Colors.GREEN))
 
-    # Git operations
-    if do_commit:
-        os.chdir(local_path)
 
-        # Check if there are changes
-        has_changes, _ = run_command(['git', 'diff', '--quiet', target_file])
-        has_staged_changes, _ = run_command(['git', 'diff', '--cached', '--quiet', target_file])
+def commit_stage(job: RepoJob, do_commit: bool, do_push: bool, dry_run: bool):
+    """Commit and optionally push review-docs.md"""
+    job.result = (True, "Repository processed successfully")
+    if not do_commit:
+        return
 
-        if has_changes or has_staged_changes:
-            print("  Committing changes...")
-            if dry_run:
-                print("  [DRY RUN] Would commit changes")
+    job.log.append("  Committing changes...")
+    if dry_run:
+        job.log.append("  [DRY RUN] Would commit changes")
+        if do_push:
+            job.log.append("  [DRY RUN] Would push to remote")
+        return
+
+    # Stage, commit and push in a single shell process
+    returncode, output = run_shell(
+        build_commit_script(do_push, job.push_args),
+        env={'REPO': job.local_path, 'TARGET': TARGET_PATH, 'MSG': COMMIT_MSG}
+    )
+    if returncode == EXIT_NO_CHANGES:
+        job.log.append(colored("  ⚠  No changes to commit (file already exists)", Colors.YELLOW))
+    elif returncode not in (0, EXIT_PUSH_FAILED):
+        job.result = (False, f"Failed to commit changes: {output.strip()}")
+    else:
+        job.log.append(colored("  ✓ Changes committed", Colors.GREEN))
+        if do_push:
+            job.log.append("  Pushing changes...")
+            if returncode == 0:
+                job.log.append(colored("  ✓ Changes pushed", Colors.GREEN))
             else:
-                run_command(['git', 'add', target_file])
-                commit_msg = """Add API documentation review command
-
-Add /review-docs slash command for consistent API documentation review
-across Ballerina connectors for low-code editor compatibility.
-
-Co-Authored-By: Claude <noreply@anthropic.com>"""
+                job.log.append(colored(f"  ✗ Failed to push changes: {output.strip()}", Colors.RED))
 
-                run_command(['git', 'commit', '-m', commit_msg])
-                print_colored("  ✓ Changes committed", Colors.GREEN)
-
-                if do_push:
-                    print("  Pushing changes...")
-                    if dry_run:
-                        print("  [DRY RUN] Would push to remote")
-                    else:
-                        success, _ = run_command(['git', 'push'])
-                        if success:
-                            print_colored("  ✓ Changes pushed", Colors.GREEN)
-                        else:
-                            print_colored("  ✗ Failed to push changes", Colors.RED)
-        else:
-            print_colored("  ⚠  No changes to commit (file already exists)", Colors.YELLOW)
 
-    return True, "Repository processed successfully"
+def run_stage(
+    stage: Callable[[RepoJob], None],
+    in_queue: queue.Queue,
+    out_queue: queue.Queue,
+    stop: threading.Event
+):
+    """
+    Apply stage to jobs from in_queue and pass them on, until a None sentinel arrives.
+    Once stop is set, remaining jobs are drained and dropped.
+    """
+    while True:
+        job = in_queue.get()
+        if job is None:
+            return
+        if stop.is_set():
+            continue
+        if job.result is None:
+            try:
+                stage(job)
+            except Exception as e:
+                job.result = (False, f"Unexpected error: {e}")
+        out_queue.put(job)
+
+
+def run_pipeline(
+    jobs: List[RepoJob],
+    stages: List[Tuple[Callable[[RepoJob], None], int]]
+) -> Iterator[RepoJob]:
+    """
+    Run jobs through (stage, worker count) pairs, each stage on its own thread pool
+    so different repositories can be checked out, written and pushed at the same time.
+    Bounded queues between stages apply backpressure. Yields jobs as they finish.
+    If the consumer stops early (e.g. Ctrl-C), jobs not yet started are dropped and
+    the worker threads exit once their current step finishes.
+    """
+    stop = threading.Event()
+    queues = [queue.Queue(maxsize=2 * workers) for _, workers in stages]
+    results: queue.Queue = queue.Queue()
+    outputs = queues[1:] + [results]
+    executors = [ThreadPoolExecutor(max_workers=workers) for _, workers in stages]
+
+    for (stage, workers), executor, in_queue, out_queue in zip(stages, executors, queues, outputs):
+        for _ in range(workers):
+            executor.submit(run_stage, stage, in_queue, out_queue, stop)
+
+    def feed():
+        for job in jobs:
+            if stop.is_set():
+                break
+            queues[0].put(job)
+        # Stop each stage once the one before it has drained
+        for (_, workers), executor, in_queue in zip(stages, executors, queues):
+            for _ in range(workers):
+                in_queue.put(None)
+            executor.shutdown(wait=True)
+
+    feeder = threading.Thread(target=feed, daemon=True)
+    feeder.start()
+    try:
+        for _ in jobs:
+            yield results.get()
+    finally:
+        stop.set()
+        feeder.join()
 
 
 def main():
@@ -178,9 +545,14 @@ def main():
     parser.add_argument('--commit', action='store_true', help='Commit the changes to git')
     parser.add_argument('--push', action='store_true', help='Push the changes to remote (requires --commit)')
     parser.add_argument('--dry-run', action='store_true', help='Show what would be done without making changes')
+    parser.add_argument('--jobs', type=int, default=32, metavar='N',
+                        help='Number of repositories to check out and push in parallel (default: 32)')
 
     args = parser.parse_args()
 
+    if args.jobs < 1:
+        parser.error('--jobs must be at least 1')
+
     if args.push:
         args.commit = True  # Push requires commit
 
@@ -197,6 +569,9 @@ def main():
         print_colored(f"Error: Source prompt file not found: {prompt_source}", Colors.RED)
         sys.exit(1)
 
+    prompt_bytes = prompt_source.read_bytes()
+    prompt_digest = hashlib.blake2b(prompt_bytes).digest()
+
     # Print header
     print_colored("=" * 50, Colors.BLUE)
     print_colored("Ballerina API Docs Review Command Deployment", Colors.BLUE)
@@ -208,6 +583,7 @@ def main():
     print(f"  Commit changes: {args.commit}")
     print(f"  Push changes: {args.push}")
     print(f"  Dry run: {args.dry_run}")
+    print(f"  Parallel jobs: {args.jobs}")
     print()
 
     # Read repository list
@@ -223,26 +599,41 @@ def main():
 
     # Create temporary directory for cloned repos
     with tempfile.TemporaryDirectory() as temp_dir:
-        # Process each repository
-        for idx, repo_path in enumerate(repos, 1):
-            print_colored("-" * 50, Colors.BLUE)
-            print_colored(f"[{idx}/{total_repos}] Processing: {repo_path}", Colors.BLUE)
-
-            success, message = process_repository(
-                repo_path,
-                str(prompt_source),
-                temp_dir,
-                args.commit,
-                args.push,
-                args.dry_run
-            )
-
-            if success:
-                print_colored(f"  ✓ {message}", Colors.GREEN)
-                successful_repos += 1
-            else:
-                print_colored(f"  ✗ {message}", Colors.RED)
-                failed_repos += 1
+        # Parallel git processes must not prompt on the terminal for credentials, SSH
+        # passphrases or host keys: fail fast instead so the repository is reported as failed
+        os.environ['GIT_TERMINAL_PROMPT'] = '0'
+        has_ssh_command, _ = run_command(['git', 'config', '--get', 'core.sshCommand'], quiet=True)
+        if not (has_ssh_command or os.environ.get('GIT_SSH_COMMAND') or os.environ.get('GIT_SSH')):
+            os.environ['GIT_SSH_COMMAND'] = 'ssh -o BatchMode=yes'
+
+        # Checkout and push are network-bound, writing is quick: give each its own pool
+        workers = min(args.jobs, total_repos)
+        stages = [
+            (partial(checkout_stage, temp_dir=temp_dir, dry_run=args.dry_run), workers),
+            (partial(write_stage, prompt_bytes=prompt_bytes, prompt_digest=prompt_digest,
+                     do_commit=args.commit, dry_run=args.dry_run), min(2, workers)),
+            (partial(commit_stage, do_commit=args.commit, do_push=args.push, dry_run=args.dry_run), workers),
+        ]
+
+        jobs = [RepoJob(repo_path) for repo_path in repos]
+        pipeline = run_pipeline(jobs, stages)
+        try:
+            for idx, job in enumerate(pipeline, 1):
+                success, message = job.result
+                print_colored("-" * 50, Colors.BLUE)
+                print_colored(f"[{idx}/{total_repos}] Processing: {job.repo_path}", Colors.BLUE)
+                for line in job.log:
+                    print(line)
+                if success:
+                    print_colored(f"  ✓ {message}", Colors.GREEN)
+                    successful_repos += 1
+                else:
+                    print_colored(f"  ✗ {message}", Colors.RED)
+                    failed_repos += 1
+        finally:
+            # Stop the workers before the temporary directory is removed under them
+            pipeline.close()
+            close_shell_workers()
 
     # Summary
     print()